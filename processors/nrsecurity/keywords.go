@@ -0,0 +1,101 @@
+package nrsecurity
+
+import (
+	"strings"
+	"unicode/utf8"
+)
+
+// keywordMatcher reports whether any sensitive keyword occurs in an attribute key.
+// It is an Aho-Corasick automaton compiled to a full transition table, so a key
+// is scanned once regardless of how many keywords are configured. ASCII case is
+// folded while scanning, so ASCII keys are never lowercased or copied.
+type keywordMatcher struct {
+	next  [][256]int32
+	match []bool
+}
+
+// newKeywordMatcher builds a matcher for the given lowercase keywords
+func newKeywordMatcher(keywords []string) *keywordMatcher {
+	m := &keywordMatcher{
+		next:  make([][256]int32, 1),
+		match: make([]bool, 1),
+	}
+
+	// Build the trie; -1 marks a missing edge until failure links fill it in
+	for i := range m.next[0] {
+		m.next[0][i] = -1
+	}
+	for _, keyword := range keywords {
+		state := int32(0)
+		for i := 0; i < len(keyword); i++ {
+			c := keyword[i]
+			if m.next[state][c] < 0 {
+				m.next = append(m.next, [256]int32{})
+				m.match = append(m.match, false)
+				child := int32(len(m.next) - 1)
+				for j := range m.next[child] {
+					m.next[child][j] = -1
+				}
+				m.next[state][c] = child
+			}
+			state = m.next[state][c]
+		}
+		m.match[state] = true
+	}
+
+	// Breadth-first pass turning the trie into a DFA: missing edges follow the
+	// failure link, and a state matches if its longest proper suffix does
+	fail := make([]int32, len(m.next))
+	queue := make([]int32, 0, len(m.next))
+	for c := 0; c < 256; c++ {
+		if child := m.next[0][c]; child < 0 {
+			m.next[0][c] = 0
+		} else {
+			queue = append(queue, child)
+		}
+	}
+	for len(queue) > 0 {
+		state := queue[0]
+		queue = queue[1:]
+		m.match[state] = m.match[state] || m.match[fail[state]]
+		for c := 0; c < 256; c++ {
+			if child := m.next[state][c]; child < 0 {
+				m.next[state][c] = m.next[fail[state]][c]
+			} else {
+				fail[child] = m.next[fail[state]][c]
+				queue = append(queue, child)
+			}
+		}
+	}
+
+	return m
+}
+
+// matches reports whether key contains any keyword, ignoring case
+func (m *keywordMatcher) matches(key string) bool {
+	if m.match[0] {
+		return true
+	}
+
+	// Non-ASCII keys take the Unicode-aware lowercase path so folding matches
+	// strings.ToLower exactly
+	for i := 0; i < len(key); i++ {
+		if key[i] >= utf8.RuneSelf {
+			key = strings.ToLower(key)
+			break
+		}
+	}
+
+	state := int32(0)
+	for i := 0; i < len(key); i++ {
+		c := key[i]
+		if 'A' <= c && c <= 'Z' {
+			c += 'a' - 'A'
+		}
+		state = m.next[state][c]
+		if m.match[state] {
+			return true
+		}
+	}
+	return false
+}
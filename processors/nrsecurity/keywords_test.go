@@ -0,0 +1,106 @@
+package nrsecurity
+
+import (
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestKeywordMatcher(t *testing.T) {
+	m := newKeywordMatcher([]string{"password", "secret", "token", "key", "api_key"})
+
+	tests := []struct {
+		key      string
+		expected bool
+	}{
+		{"password", true},
+		{"db.password", true},
+		{"PASSWORD", true},
+		{"User_PassWord_Hash", true},
+		{"client_secret", true},
+		{"x-auth-token", true},
+		{"aws.access_key_id", true},
+		{"monkey", true},
+		{"passwor", false},
+		{"service.name", false},
+		{"http.method", false},
+		{"", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.key, func(t *testing.T) {
+			assert.Equal(t, tt.expected, m.matches(tt.key))
+		})
+	}
+}
+
+func TestKeywordMatcherOverlappingKeywords(t *testing.T) {
+	// "hers" can only be found by following the failure link out of "she"
+	m := newKeywordMatcher([]string{"he", "she", "his", "hers"})
+
+	assert.True(t, m.matches("ushers"))
+	assert.True(t, m.matches("xhix his"))
+	assert.False(t, m.matches("hi_s"))
+
+	m = newKeywordMatcher([]string{"hers"})
+	assert.True(t, m.matches("shers"))
+	assert.False(t, m.matches("sher"))
+}
+
+func TestKeywordMatcherEdgeCases(t *testing.T) {
+	assert.False(t, newKeywordMatcher(nil).matches("password"))
+	assert.True(t, newKeywordMatcher([]string{""}).matches("anything"))
+
+	// Non-ASCII keys are folded the same way strings.ToLower folds them
+	m := newKeywordMatcher([]string{"key"})
+	assert.True(t, m.matches("api.Key"))
+	assert.True(t, m.matches("clé.key"))
+	assert.False(t, m.matches("clé"))
+}
+
+func TestKeywordMatcherMatchesContains(t *testing.T) {
+	keywords := createDefaultConfig().(*Config).Keywords
+	m := newKeywordMatcher(keywords)
+
+	keys := []string{
+		"service.name", "http.request.header.authorization", "db.connection_string",
+		"user.password_hash", "oauth.access_token", "PRIVATE_KEY_PATH", "net.peer.port",
+		"aws.secret_access_key", "Credentials", "process.runtime.version", "http.url",
+	}
+	for _, key := range keys {
+		expected := false
+		for _, keyword := range keywords {
+			if strings.Contains(strings.ToLower(key), keyword) {
+				expected = true
+				break
+			}
+		}
+		assert.Equal(t, expected, m.matches(key), key)
+	}
+}
+
+func TestKeywordMatcherDoesNotAllocate(t *testing.T) {
+	m := newKeywordMatcher(createDefaultConfig().(*Config).Keywords)
+
+	allocs := testing.AllocsPerRun(100, func() {
+		_ = m.matches("Process.Runtime.Version")
+	})
+	assert.Equal(t, float64(0), allocs)
+}
+
+func BenchmarkKeywordMatcher(b *testing.B) {
+	m := newKeywordMatcher(createDefaultConfig().(*Config).Keywords)
+	keys := []string{
+		"http.target",
+		"Net.Host.Name",
+		"db.statement",
+		"user.password",
+		"messaging.destination.name",
+	}
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		_ = m.matches(keys[i%len(keys)])
+	}
+}
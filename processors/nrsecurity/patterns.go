@@ -212,9 +212,13 @@ func (pm *PatternManager) RedactAll(input, replacement string) string {
 	pm.mu.RLock()
 	defer pm.mu.RUnlock()
 
+	// ReplaceAllString always copies its input, so only call it for patterns
+	// that actually match; clean strings then pass through without allocating
 	result := input
 	for _, pattern := range pm.patterns {
-		result = pattern.Pattern.ReplaceAllString(result, replacement)
+		if pattern.Pattern.MatchString(result) {
+			result = pattern.Pattern.ReplaceAllString(result, replacement)
+		}
 	}
 	return result
 }
\ No newline at end of file
@@ -193,6 +193,16 @@ func TestRedactAll(t *testing.T) {
 	}
 }
 
+func TestRedactAllNoMatchDoesNotAllocate(t *testing.T) {
+	pm := NewPatternManager()
+	input := "GET /api/v1/users/12345 returned 200 in 15ms"
+
+	allocs := testing.AllocsPerRun(100, func() {
+		_ = pm.RedactAll(input, "[REDACTED]")
+	})
+	assert.Equal(t, float64(0), allocs)
+}
+
 func TestPatternsConcurrency(t *testing.T) {
 	pm := NewPatternManager()
 
@@ -280,6 +290,16 @@ func BenchmarkMatchesAny(b *testing.B) {
 	}
 }
 
+func BenchmarkRedactAllNoMatch(b *testing.B) {
+	pm := NewPatternManager()
+	input := "GET /api/v1/users/12345 returned 200 in 15ms"
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		_ = pm.RedactAll(input, "[REDACTED]")
+	}
+}
+
 func BenchmarkRedactAll(b *testing.B) {
 	pm := NewPatternManager()
 	input := "API: AKIA1234567890ABCDEF, Password: secret123, Card: 4111111111111111"
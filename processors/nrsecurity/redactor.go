@@ -10,7 +10,7 @@ import (
 type Redactor struct {
 	config         *Config
 	patternManager *PatternManager
-	keywordSet     map[string]bool
+	keywords       *keywordMatcher
 	allowSet       map[string]bool
 	denySet        map[string]bool
 }
@@ -20,15 +20,21 @@ func NewRedactor(cfg *Config) (*Redactor, error) {
 	r := &Redactor{
 		config:         cfg,
 		patternManager: NewPatternManager(),
-		keywordSet:     make(map[string]bool),
 		allowSet:       make(map[string]bool),
 		denySet:        make(map[string]bool),
 	}
 
 	// Initialize sets
+	keywordSet := make(map[string]bool)
+	keywords := make([]string, 0, len(cfg.Keywords))
 	for _, keyword := range cfg.Keywords {
-		r.keywordSet[strings.ToLower(keyword)] = true
+		keyword = strings.ToLower(keyword)
+		if !keywordSet[keyword] {
+			keywordSet[keyword] = true
+			keywords = append(keywords, keyword)
+		}
 	}
+	r.keywords = newKeywordMatcher(keywords)
 
 	for _, allow := range cfg.AllowList {
 		r.allowSet[allow] = true
@@ -129,13 +135,7 @@ func (r *Redactor) redactValueContent(value pcommon.Value) {
 
 // containsKeyword checks if the key contains any sensitive keywords
 func (r *Redactor) containsKeyword(key string) bool {
-	lowerKey := strings.ToLower(key)
-	for keyword := range r.keywordSet {
-		if strings.Contains(lowerKey, keyword) {
-			return true
-		}
-	}
-	return false
+	return r.keywords.matches(key)
 }
 
 // shouldRedactString checks if a string value should be redacted based on patterns
@@ -23,7 +23,9 @@ func TestNewRedactor(t *testing.T) {
 	r, err := NewRedactor(cfg)
 	require.NoError(t, err)
 	assert.NotNil(t, r)
-	assert.Len(t, r.keywordSet, 2)
+	assert.True(t, r.keywords.matches("db.Password"))
+	assert.True(t, r.keywords.matches("client_secret"))
+	assert.False(t, r.keywords.matches("service.name"))
 	assert.Len(t, r.allowSet, 1)
 	assert.Len(t, r.denySet, 1)
 }
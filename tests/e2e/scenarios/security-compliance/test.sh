@@ -37,6 +37,30 @@ check_health() {
     return 1
 }
 
+# Function to POST a JSON body and require a 200 response
+check_post_ok() {
+    local description=$1
+    local url=$2
+    local body=$3
+    local max_attempts=${4:-1}
+    local attempt=0
+    local status
+
+    echo -n "Checking $description..."
+    while [ $attempt -lt $max_attempts ]; do
+        status=$(curl -s -o /dev/null -w '%{http_code}' -X POST "$url" \
+            -H "Content-Type: application/json" \
+            -d "$body")
+        if [ "$status" = "200" ]; then
+            echo -e " ${GREEN}OK${NC}"
+            return 0
+        fi
+        attempt=$((attempt + 1))
+    done
+    echo -e " ${RED}FAILED (HTTP $status)${NC}"
+    return 1
+}
+
 # Start services
 echo "Starting services..."
 cd "$SCRIPT_DIR"
@@ -67,11 +91,20 @@ curl -s -X POST http://localhost:5000/login \
     -H "Content-Type: application/json" \
     -d '{"username":"hacker","password":"wrong_password"}' > /dev/null
 
+# Non-string usernames must still get a token
+check_post_ok "non-string login username" "http://localhost:5000/login" \
+    '{"username":42,"password":"secret123"}' || FAILED=true
+
 # Payment processing
 curl -s -X POST http://localhost:5000/api/payment \
     -H "Content-Type: application/json" \
     -d '{"card_number":"4111111111111111","amount":99.99}' > /dev/null
 
+# Amounts wider than 64 bits must still be echoed back; payments fail 10% of
+# the time by design, so allow a few attempts
+check_post_ok "oversized payment amount" "http://localhost:5000/api/payment" \
+    '{"card_number":"4111111111111111","amount":100000000000000000000000}' 3 || FAILED=true
+
 # AWS endpoint
 curl -s http://localhost:5000/api/aws > /dev/null
 